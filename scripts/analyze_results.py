@@ -8,9 +8,29 @@ saves aggregated statistics and plots into mirrored subfolders.
 import os
 import glob
 import argparse
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 import matplotlib.pyplot as plt
 
+# Only these columns are parsed from each log, with fixed types
+LOG_SCHEMA = pa.schema([
+    ('seed', pa.int32()),
+    ('generation', pa.int32()),
+    ('best_fitness', pa.float64()),
+])
+CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types=LOG_SCHEMA,
+    include_columns=['generation', 'best_fitness'],
+)
+
+def format_floats(column: pa.ChunkedArray) -> pa.Array:
+    """
+    Render a float column as strings the way pandas.to_csv did: repr of
+    each value (so 500.0 keeps its '.0') and an empty field for nulls.
+    """
+    return pa.array([None if v is None else repr(v) for v in column.to_pylist()], pa.string())
+
 def parse_args():
     parser = argparse.ArgumentParser(
         description="Aggregate CSV logs and plot mean±std performance curves"
@@ -37,47 +57,59 @@ def main():
         print(f"No CSV files found in '{input_dir}'.")
         return
 
-    # Read and tag each DataFrame with its env_id (parent folder name)
-    records = []
+    # Read each CSV with Arrow's multithreaded parser and tag it with its env_id
+    tables = []
     for path in csv_paths:
         try:
-            df = pd.read_csv(path)
+            table = pa_csv.read_csv(path, convert_options=CONVERT_OPTIONS)
         except Exception as e:
             print(f"  Skipping '{path}': could not read CSV ({e})")
             continue
 
         # Extract env_id from the folder name: logs/<env_id>/seedX.csv
         env_id = os.path.basename(os.path.dirname(path))
-        df['env_id'] = env_id
-        records.append(df)
+        env_col = pa.array([env_id] * table.num_rows).dictionary_encode()
+        tables.append(table.append_column('env_id', env_col))
 
-    if not records:
+    if not tables:
         print("No valid CSV logs to process.")
         return
 
-    # Concatenate all logs
-    data = pd.concat(records, ignore_index=True)
+    # Concatenate all logs (no copy) and merge the per-file env_id dictionaries
+    data = pa.concat_tables(tables).unify_dictionaries()
 
-    # Group by env and generation, compute mean & std of best_fitness
+    # Group by env and generation, compute mean & std of best_fitness without leaving Arrow
     stats = (
         data
-        .groupby(['env_id', 'generation'])['best_fitness']
-        .agg(['mean', 'std'])
-        .reset_index()
+        .group_by(['env_id', 'generation'])
+        .aggregate([
+            ('best_fitness', 'mean'),
+            ('best_fitness', 'stddev', pc.VarianceOptions(ddof=1)),
+        ])
     )
+    stats = pa.table({
+        'env_id': stats['env_id'].cast(pa.string()),
+        'generation': stats['generation'],
+        'mean': stats['best_fitness_mean'],
+        'std': stats['best_fitness_stddev'],
+    }).sort_by([('env_id', 'ascending'), ('generation', 'ascending')])
 
     # For each environment, save plot and CSV into results/<env_id>/
-    for env_id, group in stats.groupby('env_id'):
+    for env_id in pc.unique(stats['env_id']).to_pylist():
+        group = stats.filter(pc.equal(stats['env_id'], env_id))
         env_out = os.path.join(output_dir, env_id)
         os.makedirs(env_out, exist_ok=True)
 
         # Plot mean ± std
+        generation = group['generation'].to_numpy()
+        mean = group['mean'].to_numpy()
+        std = group['std'].to_numpy()
         fig, ax = plt.subplots()
-        ax.plot(group['generation'], group['mean'], label='Mean')
+        ax.plot(generation, mean, label='Mean')
         ax.fill_between(
-            group['generation'],
-            group['mean'] - group['std'],
-            group['mean'] + group['std'],
+            generation,
+            mean - std,
+            mean + std,
             alpha=0.3,
             label='Std Dev'
         )
@@ -94,7 +126,14 @@ def main():
 
         # Save stats CSV
         summary_path = os.path.join(env_out, f"{env_id}_stats.csv")
-        group.to_csv(summary_path, index=False)
+        # Arrow prints integral floats without a decimal point, so format mean/std
+        # ourselves. Write the header too: quoting_style only applies to values,
+        # and the header should stay unquoted like the existing summaries
+        out = group.set_column(2, 'mean', format_floats(group['mean']))
+        out = out.set_column(3, 'std', format_floats(group['std']))
+        with open(summary_path, 'wb') as f:
+            f.write((','.join(out.column_names) + '\n').encode())
+            pa_csv.write_csv(out, f, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
 
         print(f"Saved results for {env_id}:")
         print(f"  Plot → {plot_path}")
@@ -1,25 +1,29 @@
 import yaml
 import argparse
+import copy
 import os
 
 def deep_merge(default: dict, override: dict) -> dict:
     """
     Recursively merge two dictionaries. Values in override take precedence.
+    Neither input is modified.
     """
-    merged = {}  # new dict
-    for key in set(default) | set(override):
-        if key in default and key in override:
-            if isinstance(default[key], dict) and isinstance(override[key], dict):
-                merged[key] = deep_merge(default[key], override[key])
-            else:
-                merged[key] = override[key]
-        elif key in override:
-            merged[key] = override[key]
-        else:
-            merged[key] = default[key]
+    merged = copy.deepcopy(default)
+    _recursive_update(merged, override)
     return merged
 
 
+def _recursive_update(target: dict, override: dict) -> None:
+    """
+    Update target in place with override, merging nested dicts key by key.
+    """
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _recursive_update(target[key], value)
+        else:
+            target[key] = copy.deepcopy(value)
+
+
 def load_experiments(config_path: str) -> list:
     """
     Load experiments from a YAML config, merging defaults with per-experiment settings.
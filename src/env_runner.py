@@ -1,5 +1,7 @@
 import gymnasium as gym
-from typing import Any, Optional
+from functools import partial
+import numpy as np
+from typing import Any, List, Optional
 
 
 class EnvRunner:
@@ -7,16 +9,26 @@ class EnvRunner:
     A generic runner for Gymnasium environments that handles seeding,
     observation/action dimensions, and evaluation of a policy network.
     """
-    def __init__(self, env_id: str, seed: Optional[int] = None):
+    def __init__(self, env_id: str, seed: Optional[int] = None, reseed_each_episode: bool = False):
         """
         Initialize the environment.
 
         Args:
             env_id:      The Gymnasium environment ID (e.g. 'CartPole-v1').
             seed:        Optional random seed for reproducibility.
+            reseed_each_episode: If True, reset episode ep with seed + ep on every call;
+                         otherwise envs are seeded once and later resets advance their RNG.
         """
         self.env_id = env_id
+        self.reseed_each_episode = reseed_each_episode
+        self.env_fn = partial(gym.make, env_id)
         self.env = gym.make(env_id)
+        # Vectorized env pool for parallel episodes (built lazily, reused across calls)
+        self._vec_env: Optional[gym.vector.VectorEnv] = None
+        self._vec_env_seeded = False
+        # Env copies for lockstep population evaluation (created lazily, reused across
+        # calls and owned by this runner, so a pool worker keeps them for its lifetime)
+        self._pop_envs: List[gym.Env] = []
 
         # Seed the environment (action & observation spaces) if provided
         self.seed = seed
@@ -54,19 +66,54 @@ class EnvRunner:
         Evaluate a policy network over a number of episodes.
 
         Args:
-            network:  An object with method act(obs, discrete) -> action.
-            episodes: Number of episodes to average over.
+            network:  An object with methods act(obs, discrete) -> action and
+                      act_batch(obs_batch, discrete) -> actions.
+            episodes: Number of episodes to average over; they run in parallel,
+                      one worker process per episode.
             render:   Whether to render the environment during evaluation.
 
         Returns:
             The average total reward across episodes.
         """
+        # Pick the specialized loop once instead of branching on every step
+        return (self._evaluate_render if render else self._evaluate_fast)(network, episodes)
+
+    def _evaluate_fast(self, network: Any, episodes: int) -> float:
+        """
+        Run all episodes in parallel on the vector env, without rendering.
+        """
+        vec_env = self._vector_env(episodes)
+        # Seed each episode-copy with seed + ep, matching the render path
+        reset_seed = None
+        if self.seed is not None and (self.reseed_each_episode or not self._vec_env_seeded):
+            reset_seed = [self.seed + ep for ep in range(episodes)]
+        obs_batch, _ = vec_env.reset(seed=reset_seed)
+        self._vec_env_seeded = True
+
+        act_batch = network.act_batch
+        step = vec_env.step
+        discrete = self.is_discrete
+        total_reward = np.zeros(episodes)
+        done = np.zeros(episodes, dtype=bool)
+        while not done.all():
+            obs_batch, rewards, terminated, truncated, info = step(act_batch(obs_batch, discrete=discrete))
+            # Finished episodes get auto-reset by the vector env; ignore their rewards
+            total_reward += np.where(done, 0.0, rewards)
+            done |= terminated | truncated
+
+        avg_reward = float(total_reward.mean())
+        return avg_reward
+
+    def _evaluate_render(self, network: Any, episodes: int) -> float:
+        """
+        Run episodes one at a time on the single env, rendering every step.
+        """
         total_reward = 0.0
 
         for ep in range(episodes):
-            # Optionally reseed per-episode for reproducibility
+            # Optionally reseed per-episode (the env was already seeded in __init__)
             reset_seed = None
-            if self.seed is not None:
+            if self.seed is not None and self.reseed_each_episode:
                 reset_seed = self.seed + ep
             obs, _ = self.env.reset(seed=reset_seed)
             done = False
@@ -75,8 +122,7 @@ class EnvRunner:
             while not done:
                 action = network.act(obs, discrete=self.is_discrete)
                 obs, reward, terminated, truncated, info = self.env.step(action)
-                if render:
-                    self.env.render()
+                self.env.render()
                 ep_reward += reward
                 done = terminated or truncated
 
@@ -85,8 +131,103 @@ class EnvRunner:
         avg_reward = total_reward / episodes
         return avg_reward
 
+    def _vector_env(self, num_envs: int) -> gym.vector.VectorEnv:
+        """
+        Return a multi-process vector env with num_envs copies, reusing the
+        cached pool when the size matches to avoid process start-up cost.
+        """
+        if self._vec_env is None or self._vec_env.num_envs != num_envs:
+            if self._vec_env is not None:
+                self._vec_env.close()
+            self._vec_env = gym.vector.AsyncVectorEnv([self.env_fn] * num_envs)
+            self._vec_env_seeded = False
+        return self._vec_env
+
+    def evaluate_population(
+        self,
+        network: Any,
+        population: np.ndarray,
+        episodes: int = 5,
+        seed: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Evaluate a whole population at once, stepping one environment copy per
+        individual in lockstep so every step is a single batched forward pass.
+
+        Args:
+            network:    An object with decode_batch(population) and
+                        act_batch(obs_batch, discrete) -> actions.
+            population: Array of shape (pop_size, num_weights).
+            episodes:   Number of episodes to average over.
+            seed:       Optional seed; episode ep of every env copy is reset with
+                        seed + ep, so all individuals face the same episodes
+                        however the population is split across calls or
+                        processes. Without it, copies are seeded once and later
+                        resets advance their RNG, which also depends on each
+                        individual's own actions in envs that draw randomness
+                        in step().
+
+        Returns:
+            Array of shape (pop_size,) with each individual's average total reward.
+        """
+        pop_size = population.shape[0]
+        envs = self._population_envs(pop_size)
+        network.decode_batch(population)
+
+        total_reward = np.zeros(pop_size)
+        obs_batch = np.empty((pop_size, self.obs_dim), dtype=np.float32)
+
+        for ep in range(episodes):
+            # Same per-episode seed for every individual, as in evaluate()
+            reset_seed = None
+            if seed is not None:
+                reset_seed = seed + ep
+            elif self.seed is not None and self.reseed_each_episode:
+                reset_seed = self.seed + ep
+            for i, env in enumerate(envs):
+                obs_batch[i], _ = env.reset(seed=reset_seed)
+            done = np.zeros(pop_size, dtype=bool)
+
+            while not done.all():
+                actions = network.act_batch(obs_batch, discrete=self.is_discrete)
+                # Finished envs keep their last obs in the batch but are not stepped
+                for i in np.flatnonzero(~done):
+                    obs, reward, terminated, truncated, info = envs[i].step(actions[i])
+                    obs_batch[i] = obs
+                    total_reward[i] += reward
+                    done[i] = terminated or truncated
+
+        return total_reward / episodes
+
+    def _population_envs(self, n: int) -> List[gym.Env]:
+        """
+        Return n environment copies for population evaluation, creating any
+        missing ones.
+
+        New copies are all seeded with self.seed, so they share the first
+        episode's start state. Later episodes only match when a seed is passed
+        to evaluate_population().
+        """
+        while len(self._pop_envs) < n:
+            env = self.env_fn()
+            env.reset(seed=self.seed)
+            self._pop_envs.append(env)
+        return self._pop_envs[:n]
+
+    def reserve(self, pop_size: int) -> None:
+        """
+        Create and seed the env copies needed to evaluate pop_size individuals up front.
+        """
+        self._population_envs(pop_size)
+
     def close(self) -> None:
         """
-        Close the environment and any rendering windows.
+        Close the environment, its population copies and any rendering windows.
         """
         self.env.close()
+        if self._vec_env is not None:
+            self._vec_env.close()
+            self._vec_env = None
+        for env in self._pop_envs:
+            env.close()
+        self._pop_envs = []
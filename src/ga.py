@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Tuple, List, Optional
+from typing import Tuple, Optional
 
 class GeneticAlgorithm:
     """
@@ -15,7 +15,8 @@ class GeneticAlgorithm:
         tournament_size: int = 3,
         elitism: bool = True,
         elitism_frac: float = 0.05,
-        rng: Optional[np.random.Generator] = None
+        rng: Optional[np.random.Generator] = None,
+        dtype: np.dtype = np.float32
     ):
         """
         Args:
@@ -27,7 +28,10 @@ class GeneticAlgorithm:
             tournament_size: Number of individuals per tournament.
             elitism: Whether to carry top individuals unchanged to next gen.
             elitism_frac: Fraction of population to carry over as elites.
-            rng: Optional NumPy random Generator for reproducibility.
+            rng: Optional NumPy random Generator for reproducibility
+                 (default: a fresh Generator backed by PCG64DXSM).
+            dtype: Floating dtype of genomes (float32 or float64); float32
+                   halves memory traffic and is plenty for network weights.
         """
         self.pop_size = pop_size
         self.genome_length = genome_length
@@ -37,34 +41,43 @@ class GeneticAlgorithm:
         self.tournament_size = tournament_size
         self.elitism = elitism
         self.elitism_frac = elitism_frac
-        self.rng = rng or np.random.default_rng()
+        self.rng = rng or np.random.default_rng(np.random.PCG64DXSM())
+        self.dtype = np.dtype(dtype)
+        # Persistent buffers refilled in place by step() every generation: a flat
+        # buffer of uniforms (crossover masks, mutation masks, per-pair crossover
+        # gates) and the Gaussian noise
+        self._rand_buf = np.empty(2 * pop_size * genome_length + pop_size, dtype=self.dtype)
+        self._noise_buf = np.empty((pop_size, genome_length), dtype=self.dtype)
 
     def init_population(self) -> np.ndarray:
         """
         Initialize population uniformly in [-1, 1].
 
         Returns:
-            pop: array of shape (pop_size, genome_length).
+            pop: array of shape (pop_size, genome_length) and dtype self.dtype.
         """
-        return self.rng.uniform(-1.0, 1.0, size=(self.pop_size, self.genome_length))
+        pop = self.rng.random((self.pop_size, self.genome_length), dtype=self.dtype)
+        pop *= 2.0
+        pop -= 1.0
+        return pop
 
-    def tournament_selection(self, fitnesses: np.ndarray) -> List[int]:
+    def tournament_selection(self, fitnesses: np.ndarray) -> np.ndarray:
         """
         Perform tournament selection to choose parent indices.
 
+        All pop_size tournaments are drawn at once; contenders are sampled
+        with replacement, as is standard for GA tournaments.
+
         Args:
             fitnesses: 1D array of length pop_size.
         Returns:
-            List of selected parent indices (length pop_size).
+            Array of selected parent indices (length pop_size).
         """
-        parents = []
-        for _ in range(self.pop_size):
-            # sample k distinct individuals
-            contenders = self.rng.choice(self.pop_size, size=self.tournament_size, replace=False)
-            # pick the best
-            winner = contenders[np.argmax(fitnesses[contenders])]
-            parents.append(winner)
-        return parents
+        # one row of k contenders per tournament
+        contenders = self.rng.integers(0, self.pop_size, size=(self.pop_size, self.tournament_size))
+        # pick the best of each row
+        winners = np.argmax(fitnesses[contenders], axis=1)
+        return contenders[np.arange(self.pop_size), winners]
 
     def crossover(self, parent1: np.ndarray, parent2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -108,32 +121,60 @@ class GeneticAlgorithm:
         Returns:
             new_population: array shape (pop_size, genome_length).
         """
-        new_pop = []
+        new_pop = np.empty((self.pop_size, self.genome_length), dtype=self.dtype)
 
-        # Elitism: carry over top individuals
+        # Elitism: carry over top individuals into the last slots
+        n_elites = 0
         if self.elitism and self.elitism_frac > 0:
             n_elites = max(1, int(self.elitism_frac * self.pop_size))
-            elite_indices = np.argsort(fitnesses)[-n_elites:]
-            elites = population[elite_indices]
-        else:
-            elites = np.empty((0, self.genome_length))
+            # Top n_elites in O(N); their order does not matter
+            elite_indices = np.argpartition(fitnesses, -n_elites)[-n_elites:]
+            new_pop[self.pop_size - n_elites:] = population[elite_indices]
+        n_children = self.pop_size - n_elites
 
-        # Parent selection
+        # Parent selection: consecutive winners form a pair (wrapping if needed)
         parent_indices = self.tournament_selection(fitnesses)
-
-        # Generate new individuals
-        for i in range(0, self.pop_size - elites.shape[0], 2):
-            idx1 = parent_indices[i]
-            idx2 = parent_indices[i+1]
-            p1 = population[idx1]
-            p2 = population[idx2]
-            c1, c2 = self.crossover(p1, p2)
-            new_pop.append(self.mutate(c1))
-            new_pop.append(self.mutate(c2))
-
-        # Trim if overfilled and concatenate elites
-        new_pop = np.array(new_pop)[: self.pop_size - elites.shape[0]]
-        if elites.size:
-            new_pop = np.vstack([new_pop, elites])
-
-        return new_pop
\ No newline at end of file
+        n_pairs = (n_children + 1) // 2
+        pair_idx = np.arange(2 * n_pairs) % self.pop_size
+        p1 = population[parent_indices[pair_idx[0::2]]]
+        p2 = population[parent_indices[pair_idx[1::2]]]
+
+        # Draw all uniforms and all noise for this generation in one call each
+        self._ensure_buffers()
+        L = self.genome_length
+        n_mask = (n_pairs + n_children) * L
+        rand = self._rand_buf[:n_mask + n_pairs]
+        self.rng.random(out=rand, dtype=self.dtype)
+        xover_rand = rand[:n_pairs * L].reshape(n_pairs, L)
+        mutation_rand = rand[n_pairs * L:n_mask].reshape(n_children, L)
+        gate_rand = rand[n_mask:]
+        noise = self._noise_buf[:n_children]
+        self.rng.standard_normal(out=noise, dtype=self.dtype)
+
+        # Uniform crossover for all pairs at once; pairs that skip crossover copy their parents.
+        # np.where beats copy + np.copyto(where=mask) here: with ~50% random masks the
+        # masked pass costs more than the writes it skips (same for masked mutation adds).
+        mask = xover_rand < 0.5
+        do_xover = gate_rand[:, None] < self.crossover_rate
+        take_p1 = mask | ~do_xover
+        child1 = new_pop[0:n_children:2]
+        child2 = new_pop[1:n_children:2]
+        child1[:] = np.where(take_p1, p1, p2)
+        child2[:] = np.where(take_p1, p2, p1)[:child2.shape[0]]
+
+        # Mutation: Gaussian noise on a random subset of genes of every child
+        children = new_pop[:n_children]
+        noise *= self.mutation_sigma
+        noise *= mutation_rand < self.mutation_rate
+        children += noise
+
+        return new_pop
+
+    def _ensure_buffers(self) -> None:
+        """
+        Reallocate the random-number buffers if pop_size or genome_length changed.
+        """
+        shape = (self.pop_size, self.genome_length)
+        if self._noise_buf.shape != shape:
+            self._rand_buf = np.empty(2 * self.pop_size * self.genome_length + self.pop_size, dtype=self.dtype)
+            self._noise_buf = np.empty(shape, dtype=self.dtype)
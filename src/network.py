@@ -1,11 +1,56 @@
 import numpy as np
-from typing import List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; act() falls back to the NumPy forward pass
+    njit = None
+
+
+def _build_forward(layer_sizes: Tuple[int, ...]):
+    """
+    Generate and JIT-compile a forward pass specialized for layer_sizes.
+
+    Every loop bound is a literal, so numba can fully unroll the tiny matmuls
+    and drop shape checks. The generated function has the signature
+    fwd(x, W0, b0, W1, b1, ..., scratch) and returns the output activations
+    as a view into scratch, a (2, max_width) float32 buffer ping-ponged
+    between layers. Hidden layers use np.tanh, the same activation as
+    act_batch(), so replayed policies match the ones selected in training;
+    the output layer is linear.
+    """
+    n_layers = len(layer_sizes) - 1
+    params = ', '.join(f'W{k}, b{k}' for k in range(n_layers))
+    lines = [f'def fwd(x, {params}, scratch):']
+    src = 'x'
+    for k in range(n_layers):
+        in_dim, out_dim = layer_sizes[k], layer_sizes[k + 1]
+        act = 'np.tanh(acc)' if k < n_layers - 1 else 'acc'
+        lines += [
+            f'    h{k} = scratch[{k % 2}]  # ({out_dim},)',
+            f'    for j in range({out_dim}):',
+            f'        acc = b{k}[j]',
+            f'        for i in range({in_dim}):',
+            f'            acc += {src}[i] * W{k}[i, j]  # W{k}: ({in_dim}, {out_dim})',
+            f'        h{k}[j] = {act}',
+        ]
+        src = f'h{k}'
+    lines.append(f'    return {src}[:{layer_sizes[-1]}]')
+
+    namespace = {'np': np}
+    exec('\n'.join(lines), namespace)
+    # Generated code has no source file, so it cannot use numba's on-disk cache
+    return njit(fastmath=True)(namespace['fwd'])
+
 
 class FeedForwardNet:
     """
     A simple feed-forward neural network that decodes a flat weight vector into
     weights and biases for each layer and provides an `act` interface.
     """
+    # JIT forward passes generated by _build_forward, shared by all nets of the same shape
+    _forward_cache: dict = {}
+
     def __init__(self, layer_sizes: List[int]):
         """
         Args:
@@ -16,32 +61,76 @@ class FeedForwardNet:
         # Precompute shapes and total number of weights
         self.shapes = [(layer_sizes[i], layer_sizes[i+1]) for i in range(len(layer_sizes)-1)]
         self.num_weights = sum(in_dim * out_dim + out_dim for in_dim, out_dim in self.shapes)
+        # Precompute per-layer genome offsets: (start_w, end_w, start_b, end_b, in_dim, out_dim)
+        self._offsets = []
+        idx = 0
+        for (in_dim, out_dim) in self.shapes:
+            end_w = idx + in_dim * out_dim
+            end_b = end_w + out_dim
+            self._offsets.append((idx, end_w, end_w, end_b, in_dim, out_dim))
+            idx = end_b
         # Placeholders for decoded parameters
         self.weights: List[np.ndarray] = []
         self.biases: List[np.ndarray] = []
+        # Preallocated parameter buffers that decode() copies each genome into
+        self.W_bufs = [np.empty((in_dim, out_dim), dtype=np.float32) for in_dim, out_dim in self.shapes]
+        self.b_bufs = [np.empty(out_dim, dtype=np.float32) for _, out_dim in self.shapes]
+        # Observation and activation buffers reused by every act() call:
+        # a ping-pong buffer for the JIT path, one per layer for NumPy
+        self._obs_buf = np.empty(layer_sizes[0], dtype=np.float32)
+        self._scratch = np.empty((2, max(layer_sizes[1:])), dtype=np.float32)
+        self._h_bufs = [np.empty(out_dim, dtype=np.float32) for _, out_dim in self.shapes]
+        # Per-layer act_batch() buffers, keyed by batch size
+        self._batch_bufs: Dict[int, List[np.ndarray]] = {}
+        # Arguments for the specialized JIT forward pass: (W0, b0, W1, b1, ..., scratch)
+        self._buf_args = tuple(p for W, b in zip(self.W_bufs, self.b_bufs) for p in (W, b)) + (self._scratch,)
+        self._fwd_args: Optional[tuple] = None  # set once decode() has run
+        self._forward = None
+        if njit is not None:
+            key = tuple(layer_sizes)
+            if key not in FeedForwardNet._forward_cache:
+                FeedForwardNet._forward_cache[key] = _build_forward(key)
+            self._forward = FeedForwardNet._forward_cache[key]
 
     def decode(self, genome: np.ndarray) -> None:
         """
         Decode a flat genome vector into the network's weight matrices and biases.
 
+        The genome is copied (cast to float32) into preallocated buffers, so the
+        network does not alias the genome and no arrays are allocated per call.
+
         Args:
             genome: 1D numpy array of length self.num_weights
         """
         assert genome.shape[0] == self.num_weights, (
             f"Genome length {genome.shape[0]} does not match expected {self.num_weights}"
         )
-        self.weights = []
-        self.biases = []
-        idx = 0
-        for (in_dim, out_dim) in self.shapes:
-            w_size = in_dim * out_dim
-            b_size = out_dim
-            W = genome[idx: idx + w_size].reshape(in_dim, out_dim)
-            idx += w_size
-            b = genome[idx: idx + b_size]
-            idx += b_size
-            self.weights.append(W)
-            self.biases.append(b)
+        for (sw, ew, sb, eb, i, o), W, b in zip(self._offsets, self.W_bufs, self.b_bufs):
+            np.copyto(W, genome[sw:ew].reshape(i, o))
+            np.copyto(b, genome[sb:eb])
+        self.weights = self.W_bufs
+        self.biases = self.b_bufs
+        self._fwd_args = self._buf_args
+
+    def decode_batch(self, population: np.ndarray) -> None:
+        """
+        Decode a whole population into stacked per-layer weight tensors.
+
+        Each layer's weights become a (pop_size, in_dim, out_dim) tensor and its
+        biases a (pop_size, out_dim) matrix. For a float32 population these are
+        views (no copy). Use act_batch() to run the decoded population.
+
+        Args:
+            population: 2D numpy array of shape (pop_size, self.num_weights)
+        """
+        assert population.ndim == 2 and population.shape[1] == self.num_weights, (
+            f"Population shape {population.shape} does not match expected (pop_size, {self.num_weights})"
+        )
+        population = population.astype(np.float32, copy=False)
+        pop_size = population.shape[0]
+        self.weights = [population[:, sw:ew].reshape(pop_size, i, o) for sw, ew, _, _, i, o in self._offsets]
+        self.biases = [population[:, sb:eb] for _, _, sb, eb, _, _ in self._offsets]
+        self._fwd_args = None
 
     def act(self, obs: Any, discrete: bool = True) -> Any:
         """
@@ -54,14 +143,88 @@ class FeedForwardNet:
         # Ensure genome has been decoded
         assert self.weights and self.biases, "Network parameters not decoded. Call decode() first."
 
-        x = np.array(obs, dtype=np.float32)
+        # Most envs already return float32 arrays; cast anything else into the
+        # preallocated buffer instead of allocating a new array per step
+        x = np.asarray(obs)
+        if x.dtype != np.float32:
+            np.copyto(self._obs_buf, x)
+            x = self._obs_buf
+
+        if self._forward is not None and self._fwd_args is not None:
+            # Output is a view into the scratch buffer; copy before handing it out
+            logits = self._forward(x, *self._fwd_args)
+            if discrete:
+                return int(np.argmax(logits))
+            else:
+                return logits.copy()
+
         # Forward through hidden layers with tanh activation
-        for W, b in zip(self.weights[:-1], self.biases[:-1]):
-            x = np.tanh(x @ W + b)
+        for W, b, h in zip(self.weights[:-1], self.biases[:-1], self._h_bufs):
+            np.dot(x, W, out=h)
+            h += b
+            np.tanh(h, out=h)
+            x = h
         # Output layer
-        logits = x @ self.weights[-1] + self.biases[-1]
+        logits = self._h_bufs[-1]
+        np.dot(x, self.weights[-1], out=logits)
+        logits += self.biases[-1]
 
         if discrete:
             return int(np.argmax(logits))
         else:
-            return logits
+            return logits.copy()
+
+    def act_batch(self, obs_batch: Any, discrete: bool = True) -> np.ndarray:
+        """
+        Forward-pass a batch of observations through the network.
+
+        After decode(), every row goes through the same network (e.g. parallel
+        episodes of one policy). After decode_batch(), row i goes through
+        individual i's network.
+
+        Args:
+            obs_batch: array of shape (batch, obs_dim)
+            discrete: if True, returns int actions via argmax; else raw network outputs
+        Returns:
+            Array of shape (batch,) for discrete actions, else (batch, action_dim).
+        """
+        # Ensure genome has been decoded
+        assert self.weights and self.biases, "Network parameters not decoded. Call decode() first."
+
+        x = np.asarray(obs_batch, dtype=np.float32)
+        bufs = self._batch_buffers(x.shape[0])
+        # Forward through hidden layers with tanh activation, in place in each layer's buffer
+        for W, b, h in zip(self.weights[:-1], self.biases[:-1], bufs):
+            self._batch_matmul(x, W, out=h)
+            h += b
+            np.tanh(h, out=h)
+            x = h
+        # Output layer
+        logits = bufs[-1]
+        self._batch_matmul(x, self.weights[-1], out=logits)
+        logits += self.biases[-1]
+
+        if discrete:
+            return np.argmax(logits, axis=-1)
+        else:
+            return logits.copy()
+
+    def _batch_buffers(self, batch: int) -> List[np.ndarray]:
+        """
+        Return the (batch, out_dim) activation buffers for every layer, allocating them once per batch size.
+        """
+        bufs = self._batch_bufs.get(batch)
+        if bufs is None:
+            bufs = [np.empty((batch, out_dim), dtype=np.float32) for _, out_dim in self.shapes]
+            self._batch_bufs[batch] = bufs
+        return bufs
+
+    @staticmethod
+    def _batch_matmul(x: np.ndarray, W: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Multiply (batch, in_dim) inputs by shared (in_dim, out_dim) weights or
+        by per-row (batch, in_dim, out_dim) weights, writing into out.
+        """
+        if W.ndim == 3:
+            return np.einsum('pij,pi->pj', W, x, out=out)
+        return np.matmul(x, W, out=out)
@@ -1,11 +1,32 @@
 import os
-import csv
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from src.config import get_experiments
 from src.env_runner import EnvRunner
 from src.network import FeedForwardNet
 from src.ga import GeneticAlgorithm
 
+# Per-process EnvRunner and FeedForwardNet used by pool workers (set by _init_worker)
+_worker_state: dict = {}
+
+
+def _init_worker(env_id: str, seed: int, layer_sizes: list, chunk_size: int) -> None:
+    """
+    Pool initializer: build this worker's runner and network once and warm
+    the env copies for chunks of up to chunk_size individuals.
+    """
+    runner = EnvRunner(env_id, seed)
+    runner.reserve(chunk_size)
+    _worker_state['runner'] = runner
+    _worker_state['net'] = FeedForwardNet(layer_sizes)
+
+
+def _eval_chunk(chunk: np.ndarray, episodes: int, eval_seed: int) -> np.ndarray:
+    """
+    Evaluate a slice of the population inside a pool worker.
+    """
+    return _worker_state['runner'].evaluate_population(_worker_state['net'], chunk, episodes, eval_seed)
+
 
 def run_experiment(exp: dict, log_dir: str = 'logs'):
     """
@@ -18,6 +39,8 @@ def run_experiment(exp: dict, log_dir: str = 'logs'):
       - seeds: list of int
       - generations: int
       - episodes_per_eval: int
+      - n_workers: optional int, processes used to evaluate the population
+                   (default/null: all CPU cores; 1: evaluate in-process)
 
     Writes one CSV per seed to log_dir/{env_id}_seed{seed}.csv
     """
@@ -27,6 +50,7 @@ def run_experiment(exp: dict, log_dir: str = 'logs'):
     seeds = exp['seeds']
     generations = exp['generations']
     episodes = exp['episodes_per_eval']
+    n_workers = exp.get('n_workers') or os.cpu_count() or 1
 
     log_dir = os.path.join(log_dir, env_id)
     os.makedirs(log_dir, exist_ok=True)
@@ -47,31 +71,61 @@ def run_experiment(exp: dict, log_dir: str = 'logs'):
             mutation_sigma=ga_params.get('mutation_sigma', 0.1),
             tournament_size=ga_params.get('tournament_size', 3),
             elitism=ga_params.get('elitism', True),
-            elitism_frac=ga_params.get('elitism_frac', 0.05)
+            elitism_frac=ga_params.get('elitism_frac', 0.05),
+            rng=np.random.default_rng(np.random.PCG64DXSM(seed))
         )
+        # Worker pool for fitness evaluation, each worker with its own runner + network
+        pool = None
+        n_procs = min(n_workers, ga.pop_size)
+        if n_procs > 1:
+            # A few chunks per worker to even out differing episode lengths
+            n_chunks = min(ga.pop_size, 4 * n_procs)
+            chunk_size = -(-ga.pop_size // n_chunks)
+            pool = ProcessPoolExecutor(
+                max_workers=n_procs,
+                initializer=_init_worker,
+                initargs=(env_id, seed, layer_sizes, chunk_size)
+            )
+
         # Initialize population
         population = ga.init_population()
 
-        # Prepare log file
-        log_path = os.path.join(log_dir, f"seed{seed}.csv")
-        with open(log_path, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['seed', 'generation', 'best_fitness'])
+        # Per-generation log rows (seed, generation, best_fitness), written once at the end
+        log = np.empty((generations, 3))
 
+        # Shut the pool down even if evaluation or logging fails, so workers don't leak
+        try:
             # Evolve
             for gen in range(generations):
-                fitnesses = np.zeros(ga.pop_size)
-                for i in range(ga.pop_size):
-                    genome = population[i]
-                    net.decode(genome)
-                    fitnesses[i] = runner.evaluate(net, episodes)
+                # Evaluate the population in lockstep (one batched forward pass per step),
+                # split into chunks across the worker pool if there is one. Episode ep
+                # of every individual is reset with eval_seed + ep, a fresh base seed per
+                # (seed, generation), so all individuals are compared on the same episodes.
+                eval_seed = int(np.random.SeedSequence([seed, gen]).generate_state(1)[0])
+                if pool is None:
+                    fitnesses = runner.evaluate_population(net, population, episodes, eval_seed)
+                else:
+                    chunks = np.array_split(population, n_chunks)
+                    fitnesses = np.concatenate(list(pool.map(
+                        _eval_chunk, chunks, [episodes] * n_chunks, [eval_seed] * n_chunks
+                    )))
                 best = float(np.max(fitnesses))
                 if gen % 10 == 0 or gen == generations - 1:
                     print(f"{env_id}  seed={seed}  gen={gen:3d}  best={best:.1f}")
-                writer.writerow([seed, gen, best])
+                log[gen] = (seed, gen, best)
                 population = ga.step(population, fitnesses)
 
-        runner.close()
+            # Write log file
+            log_path = os.path.join(log_dir, f"seed{seed}.csv")
+            np.savetxt(
+                log_path, log, fmt=['%d', '%d', '%.6f'], delimiter=',',
+                header='seed,generation,best_fitness', comments=''
+            )
+        finally:
+            if pool is not None:
+                pool.shutdown()
+            runner.close()
+
         print(f"Finished {env_id} seed={seed}, logs -> {log_path}")
 
 